@@ -59,7 +59,7 @@ def _format_flag(flag: str, prefix: str = "") -> str:
         return f"{prefix}_{flag}" if prefix else flag
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Argument:
     """Argument for an argument parser.
 
@@ -185,7 +185,7 @@ class Argument:
             return self.default
 
 
-@dataclass
+@dataclass(slots=True)
 class Arguments:
     """Arguments for an argument parser.
 
@@ -237,41 +237,48 @@ class Arguments:
         return self._dests  # type: ignore
 
     def _contains_dest(self, dest: str) -> bool:
-        if dest in self._dests:
-            return True
-        if self._parent:
-            parent_dest = _format_dest(dest, self.prefix)
-            for parent in self._parent:
-                if parent._contains_dest(parent_dest):
-                    return True
+        stack: list[tuple[Arguments, str]] = [(self, dest)]
+        while stack:
+            args, dest = stack.pop()
+            if dest in args._dests:
+                return True
+            if args._parent:
+                parent_dest = _format_dest(dest, args.prefix)
+                stack.extend((parent, parent_dest) for parent in args._parent)
         return False
 
     def _contains_flag(self, flag: str) -> bool:
-        if flag in self._flags:
-            return True
-        if self._parent:
-            parent_flag = _format_flag(flag, self.prefix)
-            if parent_flag:
-                for parent in self._parent:
-                    if parent._contains_flag(parent_flag):
-                        return True
+        stack: list[tuple[Arguments, str]] = [(self, flag)]
+        while stack:
+            args, flag = stack.pop()
+            if flag in args._flags:
+                return True
+            if args._parent:
+                parent_flag = _format_flag(flag, args.prefix)
+                if parent_flag:
+                    stack.extend((parent, parent_flag) for parent in args._parent)
         return False
 
     def _add_dest(self, dest: str) -> None:
-        self._dests.add(dest)
-        if self._parent:
-            parent_dest = _format_dest(dest, self.prefix)
-            for parent in self._parent:
-                parent._add_dest(parent_dest)
+        stack: list[tuple[Arguments, str]] = [(self, dest)]
+        while stack:
+            args, dest = stack.pop()
+            args._dests.add(dest)
+            if args._parent:
+                parent_dest = _format_dest(dest, args.prefix)
+                stack.extend((parent, parent_dest) for parent in args._parent)
 
     def _add_flag(self, flag: str | None) -> None:
-        if flag:
-            self._flags.add(flag)
-            if self._parent:
-                parent_flag = _format_flag(flag, self.prefix)
+        if not flag:
+            return
+        stack: list[tuple[Arguments, str]] = [(self, flag)]
+        while stack:
+            args, flag = stack.pop()
+            args._flags.add(flag)
+            if args._parent:
+                parent_flag = _format_flag(flag, args.prefix)
                 if parent_flag:
-                    for parent in self._parent:
-                        parent._add_flag(parent_flag)
+                    stack.extend((parent, parent_flag) for parent in args._parent)
 
     def add_argument(self, *args, **kwargs) -> None:
         """Add an argument.
@@ -411,11 +418,12 @@ class Arguments:
                     parsed[arg.scope] = arg.to_dict()
             elif arg.dest in loaded:
                 value = loaded[arg.dest]
-                if isinstance(value, str) and "type" in arg.kwargs:
-                    value = arg.kwargs["type"](value)
-                elif isinstance(value, list) and "nargs" in arg.kwargs and arg.kwargs["nargs"] != 1:
-                    if len(value) > 0 and isinstance(value[0], str) and "type" in arg.kwargs:
-                        value = [arg.kwargs["type"](v) for v in value]
+                arg_type = arg.kwargs.get("type", None)
+                if arg_type is not None and isinstance(value, str):
+                    value = arg_type(value)
+                elif arg_type is not None and isinstance(value, list) and arg.kwargs.get("nargs", 1) != 1:
+                    if len(value) > 0 and isinstance(value[0], str):
+                        value = [arg_type(v) for v in value]
                 parsed[arg.dest] = value
             elif not reduced:
                 value = arg.default
@@ -34,12 +34,17 @@ __all__ = [
 
 FIELD_DOCS = "__field_docs__"
 FIELD_DOC = "__doc__"
+FIELD_TYPES = "__field_types__"
+INIT_FIELDS = "__init_fields__"
 ARGPARSE_ARGS = "_argparse_args_"
 ARGPARSE_KWARGS = "_argparse_kwargs_"
 
 
 _T = TypeVar("_T")
 
+_DEFAULT_REGEX = re.compile(r"\s*[Dd]efault(?: is | = |: | to|)\s*(.+)\.")
+_DUMP_SCALAR_TYPES = frozenset((str, int, float, complex, bool, type(None)))
+
 
 def configclass(cls: Type[_T], /) -> Type[_T]:
     """Decorator for config classes.
@@ -63,44 +68,60 @@ def configclass(cls: Type[_T], /) -> Type[_T]:
     return cls
 
 
+def _format_field_doc(doc: str | None) -> str:
+    """Format a field description by removing the default statement and line breaks."""
+    if not doc:
+        return ""
+    if "efault" in doc:  # only run the regex when there may be a default statement
+        doc = _DEFAULT_REGEX.sub("", doc)
+    return doc.strip().replace("\n", "")
+
+
 def _set_field_docs(cls) -> None:
     """Set field docs from the docstring of a config dataclass."""
     doc: str = cls.__doc__
     fields = getattr(cls, _FIELDS)  # include both fields and initvars
-    field_docs: dict[str, str] = getattr(cls, FIELD_DOCS, {})
+    field_docs: dict[str, str] = dict(getattr(cls, FIELD_DOCS, {}))  # copy to not update the parent class docs
     if doc:
         parsed_doc = docstring_parser.parse(doc)
-        remove_default_regex = re.compile(r"\s*[Dd]efault(?: is | = |: | to|)\s*(.+)\.")
-        # we first go through args
+        # we go through args and attributes in one pass
         initarg_docs: dict[str, str] = {}
-        for param in parsed_doc.params:
-            if param.args[0] == "param":
-                field_name = param.arg_name
-                field_doc = param.description if param.description else ""
-                field_doc = remove_default_regex.sub("", field_doc).strip().replace("\n", "")
-                if field_name in fields:
-                    assert (
-                        field_name not in initarg_docs
-                    ), f"Duplicate Init Arg {field_name} in {cls.__name__} docstring"
-                    initarg_docs[field_name] = field_doc
-        # then we go through attributes
         attr_docs: dict[str, str] = {}
         for param in parsed_doc.params:
-            if param.args[0] == "attribute":
-                field_name = param.arg_name
-                field_doc = param.description if param.description else ""
-                field_doc = remove_default_regex.sub("", field_doc).strip().replace("\n", "")
-                if field_name in fields:
-                    assert field_name not in attr_docs, f"Duplicate Attribute {field_name} in {cls.__name__} docstring"
-                    attr_docs[field_name] = field_doc
-        # then we update the field docs
+            field_name = param.arg_name
+            if field_name not in fields:
+                continue
+            kind = param.args[0]
+            if kind == "param":
+                assert field_name not in initarg_docs, f"Duplicate Init Arg {field_name} in {cls.__name__} docstring"
+                initarg_docs[field_name] = _format_field_doc(param.description)
+            elif kind == "attribute":
+                assert field_name not in attr_docs, f"Duplicate Attribute {field_name} in {cls.__name__} docstring"
+                attr_docs[field_name] = _format_field_doc(param.description)
+        # then we update the field docs, args take precedence over attributes
         attr_docs.update(initarg_docs)
         field_docs.update(attr_docs)
     setattr(cls, FIELD_DOCS, field_docs)
 
 
 def _get_init_fields(cls) -> tuple[Field, ...]:
-    return tuple(f for f in getattr(cls, _FIELDS).values() if f._field_type in (_FIELD, _FIELD_INITVAR) and f.init)
+    """Get the init fields (including initvars) of a dataclass, cached on the class."""
+    fields: tuple[Field, ...] | None = cls.__dict__.get(INIT_FIELDS, None)
+    if fields is None:
+        fields = tuple(
+            f for f in getattr(cls, _FIELDS).values() if f._field_type in (_FIELD, _FIELD_INITVAR) and f.init
+        )
+        setattr(cls, INIT_FIELDS, fields)
+    return fields
+
+
+def _get_init_field_types(cls) -> dict[str, tuple[Any, bool]]:
+    """Get the parsed types of init fields, resolved once and cached on the class."""
+    field_types: dict[str, tuple[Any, bool]] | None = cls.__dict__.get(FIELD_TYPES, None)
+    if field_types is None:
+        field_types = {field.name: parse_field_type(field.type) for field in _get_init_fields(cls)}
+        setattr(cls, FIELD_TYPES, field_types)
+    return field_types
 
 
 def get_arguments(  # noqa: C901
@@ -132,6 +153,7 @@ def get_arguments(  # noqa: C901
 
     # we only include init fields since they are used to construct the config
     fields = _get_init_fields(cls)
+    field_types = _get_init_field_types(cls)
     field_docs = getattr(cls, FIELD_DOCS, {})
     parser = Arguments(scope=scope, prefix=prefix)
     for field in fields:
@@ -141,8 +163,10 @@ def get_arguments(  # noqa: C901
                 fn(parser)
             continue
         _dest = field.name
-        _kwargs: dict[str, Any] = field.metadata.get(ARGPARSE_KWARGS, {})
-        field_type, field_type_optional = parse_field_type(field.type)
+        _metadata = field.metadata
+        # copy the argparse kwargs since they are completed below and must not leak into the field metadata
+        _kwargs: dict[str, Any] = dict(_metadata.get(ARGPARSE_KWARGS, {}))
+        field_type, field_type_optional = field_types[field.name]
 
         if hasattr(field_type, "get_arguments"):
             _scope = _kwargs.get("scope", _dest)
@@ -155,19 +179,13 @@ def get_arguments(  # noqa: C901
                         default = field.default_factory()
                 else:
                     default = field.default
-                if default is None:  # default is not enable
-                    parser.add_argument(
-                        f"--enable-{_format_prefix_to_flag(_prefix)}",
-                        action="store_true",
-                        help=f"Enable {_dest}.",
-                    )
-                else:  # default is enable
-                    parser.add_argument(
-                        f"--disable-{_format_prefix_to_flag(_prefix)}",
-                        action="store_false",
-                        dest=f"enable_{_prefix}",
-                        help=f"Enable {_dest}.",
-                    )
+                enabled = default is not None
+                parser.add_argument(
+                    f"--{'disable' if enabled else 'enable'}-{_format_prefix_to_flag(_prefix)}",
+                    action="store_false" if enabled else "store_true",
+                    dest=f"enable_{_prefix}",
+                    help=f"Enable {_dest}.",
+                )
             _n = len(_prefix) + (1 if _prefix else 0)
             parser.add_arguments(
                 field_type.get_arguments(
@@ -182,7 +200,7 @@ def get_arguments(  # noqa: C901
         # get dest from field name
         _kwargs["dest"] = _dest
         # get help description from docstring of field
-        _kwargs.setdefault("help", field.metadata.get(FIELD_DOC, field_docs.get(field.name, "")))
+        _kwargs.setdefault("help", _metadata.get(FIELD_DOC, field_docs.get(field.name, "")))
         # get default from field type and default
         if _dest in defaults:
             _default = defaults[_dest]
@@ -219,14 +237,14 @@ def get_arguments(  # noqa: C901
                 _kwargs["action"] = "store_true"
             _kwargs.pop("type", None)
         # get flag from field name
-        _flags = tuple(set(field.metadata.get(ARGPARSE_ARGS, [_flag])))
+        _flags = tuple(set(_metadata.get(ARGPARSE_ARGS, [_flag])))
         # get type from field type
         if "type" in _kwargs or field_type is bool:
             pass
         elif field_type in (str, int, float, complex):
             _kwargs["type"] = field_type
         elif issubclass(field_type, Enum):
-            _kwargs["type"] = lambda x, field_type=field_type: field_type[x.split(".")[-1]]
+            _kwargs["type"] = lambda x, field_type=field_type: field_type[x.rsplit(".", 1)[-1]]
             _kwargs["choices"] = [e for e in field_type]
         elif isinstance(field_type, type) and hasattr(field_type, "from_str"):
             _kwargs["type"] = field_type.from_str
@@ -258,12 +276,16 @@ def from_dict(cls: Type[_T], /, parsed_args: dict[str, Any], **overwrites) -> _T
     if hasattr(cls, "update_from_dict"):
         parsed_args, overwrites = cls.update_from_dict(parsed_args=parsed_args, overwrites=overwrites)
     fields = _get_init_fields(cls)
+    field_types = _get_init_field_types(cls)
     kwargs = {}
     for field in fields:
-        if field.name in overwrites:
-            kwargs[field.name] = overwrites[field.name]
-        elif field.name in parsed_args:
-            field_type, field_type_optional = parse_field_type(field.type)
+        value = overwrites.get(field.name, MISSING)
+        if value is not MISSING:
+            kwargs[field.name] = value
+            continue
+        value = parsed_args.get(field.name, MISSING)
+        if value is not MISSING:
+            field_type, field_type_optional = field_types[field.name]
             if hasattr(field_type, "from_dict"):
                 if field_type_optional and not parsed_args.get(f"enable_{field.name}", False):
                     kwargs[field.name] = None
@@ -272,11 +294,11 @@ def from_dict(cls: Type[_T], /, parsed_args: dict[str, Any], **overwrites) -> _T
                     _prefix = _kwargs.get("prefix", remove_suffix(field.name, CONFIG_SUFFIXES))
                     _n = len(_prefix) + (1 if _prefix else 0)
                     kwargs[field.name] = field_type.from_dict(
-                        parsed_args[field.name],
+                        value,
                         **{k[_n:]: v for k, v in overwrites.items() if k.startswith(_prefix)},
                     )
             else:
-                kwargs[field.name] = parsed_args[field.name]
+                kwargs[field.name] = value
     return cls(**kwargs)
 
 
@@ -294,18 +316,20 @@ def formatted_str(self: _T, /, indent: int = 2, level: int = 0) -> str:
     level += 1
     _ = " " * indent * level
     fields = _get_fields(self)
-    s = f"{self.__class__.__name__}("
+    lines: list[str] = []
     for field in fields:
         value = getattr(self, field.name)
         if hasattr(value, "formatted_str"):
-            s += f"\n{_}{field.name}={value.formatted_str(indent=indent, level=level)},"
+            lines.append(f"\n{_}{field.name}={value.formatted_str(indent=indent, level=level)}")
         else:
-            s += f"\n{_}{field.name}={value},"
-    return s[:-1] + ")"
+            lines.append(f"\n{_}{field.name}={value}")
+    return f"{self.__class__.__name__}({','.join(lines)})"
 
 
 def _to_dump_value(value: Any) -> Any:
-    if hasattr(value, "dump"):
+    if type(value) in _DUMP_SCALAR_TYPES:  # exact builtin scalars, subclasses (e.g., IntEnum) take the slow path
+        return value
+    elif hasattr(value, "dump"):
         return value.dump()
     elif value is None:
         return None
@@ -331,8 +355,9 @@ def dump(self: _T, path: str = "") -> dict[str, Any]:
         dict[str, Any]: The dict.
     """
     rst = {}
+    field_types = _get_init_field_types(self.__class__)
     for field in _get_init_fields(self.__class__):
-        field_type, field_type_optional = parse_field_type(field.type)
+        field_type, field_type_optional = field_types[field.name]
         value = _to_dump_value(getattr(self, field.name))
         if field_type_optional and hasattr(field_type, "get_arguments"):
             if value is None:
@@ -84,10 +84,10 @@ class ConfigParser:
         scope, prefix = format_scope_and_prefix(cfg, scope=scope, prefix=prefix)
         assert scope != self.FILE_SCOPE, f"scope {scope} is reserved for config files"
         assert scope not in self._cfgs, f"scope {scope} already exists"
-        if len(self._cfgs) == 1:
-            _s = next(iter(self._cfgs))
-            assert _s.isidentifier(), f"scope {_s} is not a valid identifier"
-        if len(self._cfgs) >= 1:
+        if self._cfgs:  # scopes must be valid identifiers when there are multiple configs
+            if len(self._cfgs) == 1:
+                _s = next(iter(self._cfgs))
+                assert _s.isidentifier(), f"scope {_s} is not a valid identifier"
             assert scope.isidentifier(), f"scope {scope} is not a valid identifier"
         args = cfg.get_arguments(scope=scope, prefix=prefix, **defaults)
         args.add_to_parser(self._parser, suppress=True)
@@ -126,45 +126,46 @@ class ConfigParser:
         del imported_config_paths
         assert len(config_paths) > 0, "no config file(s) provided"
         loaded, filenames = {}, []
-        default_paths = []
+        default_paths, default_probes = [], {}
+        cwd = os.getcwd()
         for path in config_paths:
             assert os.path.isfile(path), f"{path} is not a file"
             assert path.endswith(self.FILE_EXTS), f"{path} is not a config file"
             # make sure config_path is under the current working directory
-            rel_path = os.path.relpath(path, os.getcwd())
-            assert not rel_path.startswith(".."), f"{path} is not under {os.getcwd()}"
+            rel_path = os.path.relpath(path, cwd)
+            assert not rel_path.startswith(".."), f"{path} is not under {cwd}"
             # config file should place under a subdirectory of the current working directory
             _paths = rel_path.split(os.sep)
-            assert len(_paths) > 1, f"{path} is not under a subfolder of {os.getcwd()}"
+            assert len(_paths) > 1, f"{path} is not under a subfolder of {cwd}"
             filename = _paths[-1]
-            len_ext = len(filename.split(".")[-1]) + 1
+            len_ext = len(filename.rsplit(".", 1)[-1]) + 1
             filenames.append(filename[:-len_ext])
             cfg_dir = ""
             for dirname in _paths[:-1]:
                 cfg_dir = os.path.join(cfg_dir, dirname)
-                for ext in self.FILE_EXTS:
-                    default_path = os.path.join(cfg_dir, f"__default__.{ext}")
-                    if os.path.isfile(default_path) and default_path not in default_paths:
+                _defaults = default_probes.get(cfg_dir, None)
+                if _defaults is None:  # probe each directory only once across config files
+                    _defaults = [os.path.join(cfg_dir, f"__default__.{ext}") for ext in self.FILE_EXTS]
+                    _defaults = default_probes[cfg_dir] = [p for p in _defaults if os.path.isfile(p)]
+                for default_path in _defaults:
+                    if default_path not in default_paths:
                         default_paths.append(default_path)
                         break
         for path in default_paths:
             loaded = update_dict(loaded, self._load(path))
         for path in config_paths:
             loaded = update_dict(loaded, self._load(path))
-        parsed, single = {}, len(self._cfgs) == 1
+        cfgs, parsed, single = {}, {}, len(self._cfgs) == 1
         if single:
             loaded[next(iter(self._cfgs))] = loaded
         cfg_name = "[" + "]+[".join(filenames) + "]"
-        for scope, (cfg, args, prefix) in self._cfgs.items():
-            parsed[scope] = args.parse(loaded[scope], reduced=False)
-        cfgs = {}
         for scope, (cfg, args, prefix) in self._cfgs.items():
             prefix_ = f"{prefix}_" if prefix else ""
             _n = len(prefix_)
-            update_dict(parsed[scope], args.to_dict(parsed_args, prefix=prefix, reduced=True), strict=True)
-            cfgs[scope] = cfg.from_dict(
-                parsed[scope], **{k[_n:]: v for k, v in defaults.items() if k.startswith(prefix_)}
-            )
+            _parsed = args.parse(loaded[scope], reduced=False)
+            update_dict(_parsed, args.to_dict(parsed_args, prefix=prefix, reduced=True), strict=True)
+            parsed[scope] = _parsed
+            cfgs[scope] = cfg.from_dict(_parsed, **{k[_n:]: v for k, v in defaults.items() if k.startswith(prefix_)})
         if single:
             cfgs = next(iter(cfgs.values()))
             parsed = next(iter(parsed.values()))
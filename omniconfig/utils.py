@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Utils for omniconfig."""
+import functools
 import types
 import typing
 from enum import Enum
@@ -7,6 +8,13 @@ from enum import Enum
 import toml
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML is built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 __all__ = [
     "CONFIG_SUFFIXES",
     "parse_field_type",
@@ -33,22 +41,29 @@ def parse_field_type(tp: typing.Any) -> tuple[typing.Any, bool]:
     Returns:
         tuple[typing.Any, bool]: The parsed type and whether it is optional.
     """
+    if type(tp) is type:  # plain classes, e.g., int, str or config dataclasses
+        return tp, False
     if hasattr(tp, "__origin__"):
         if tp.__origin__ is typing.Union:
-            ntp = tuple(arg for arg in tp.__args__ if arg is not type(None))
-            return typing.Union[ntp], len(tp.__args__) != len(ntp)
+            return _parse_union_args(tp.__args__)
         elif tp.__origin__ is typing.Optional:
             return tp.__args__[0], True
         else:
             return tp, False
     else:
         if isinstance(tp, types.UnionType):
-            ntp = tuple(arg for arg in tp.__args__ if arg is not type(None))
-            return typing.Union[ntp], len(tp.__args__) != len(ntp)
+            return _parse_union_args(tp.__args__)
         else:
             return tp, False
 
 
+def _parse_union_args(args: tuple[typing.Any, ...]) -> tuple[typing.Any, bool]:
+    ntp = tuple(arg for arg in args if arg is not type(None))
+    if len(ntp) == 1:  # no need to re-parametrize typing.Union for a single type, e.g., Optional[int]
+        return ntp[0], len(args) != 1
+    return typing.Union[ntp], len(args) != len(ntp)
+
+
 def remove_suffix(name: str, suffixes: tuple[str]) -> str:
     """Remove suffixes from a name.
 
@@ -122,12 +137,23 @@ def update_dict(
     """
     if len(d) == 0:
         return u
-    for k, v in u.items():
-        if not strict or k in d:
+    # walk the nested dictionaries depth-first with a stack of item iterators and update them in place,
+    # descending as soon as a nested dictionary is met so that writes keep the key order (sub-dictionaries
+    # may be shared, e.g., via yaml aliases); only the top level is updated strictly
+    stack: list[tuple[dict, typing.Iterator, bool]] = [(d, iter(u.items()), strict)]
+    while stack:
+        dst, items, _strict = stack[-1]
+        for k, v in items:
+            if _strict and k not in dst:
+                continue
             if isinstance(v, dict):
-                d[k] = update_dict(d.get(k, {}), v)
-            else:
-                d[k] = v
+                sub = dst.get(k, None)
+                if isinstance(sub, dict) and len(sub) > 0:
+                    stack.append((sub, iter(v.items()), False))
+                    break
+            dst[k] = v
+        else:
+            stack.pop()
     return d
 
 
@@ -141,7 +167,25 @@ def load_yaml(path: str) -> typing.Any:
         typing.Any: The object loaded from the yaml file.
     """
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@functools.cache
+def _get_yaml_dumper(str_unsupported: bool, ignore_aliases: bool) -> type:
+    """Get a dumper class derived from the (libyaml-backed if available) safe dumper, created once per options."""
+    if not str_unsupported and not ignore_aliases:
+        return _YamlDumper
+    Dumper = type("Dumper", (_YamlDumper,), {})
+    if str_unsupported:
+        Dumper.add_representer(
+            None,
+            lambda self, data: self.represent_scalar(
+                "tag:yaml.org,2002:str", data.name if isinstance(data, Enum) else str(data)
+            ),
+        )
+    if ignore_aliases:
+        Dumper.ignore_aliases = lambda self, data: True
+    return Dumper
 
 
 def dump_yaml(
@@ -159,20 +203,7 @@ def dump_yaml(
     kwargs.setdefault("default_flow_style", False)
     kwargs.setdefault("sort_keys", False)
     kwargs.setdefault("indent", 2)
-    # dynamic create a dumper class from yaml.SafeDumper
-    if str_unsupported or ignore_aliases:
-        Dumper = type("Dumper", (yaml.SafeDumper,), {})
-        if str_unsupported:
-            Dumper.add_representer(
-                None,
-                lambda self, data: self.represent_scalar(
-                    "tag:yaml.org,2002:str", data.name if isinstance(data, Enum) else str(data)
-                ),
-            )
-        if ignore_aliases:
-            Dumper.ignore_aliases = lambda self, data: True
-    else:
-        Dumper = yaml.SafeDumper
+    Dumper = _get_yaml_dumper(str_unsupported, ignore_aliases)
     if path is None:
         return yaml.dump(obj, Dumper=Dumper, **kwargs)
     with open(path, "w", encoding="utf-8") as f: